@@ -3,6 +3,7 @@
 
 #include <algorithm>
 #include <cmath>
+#include <cstdint>
 #include <cstring>
 #include <stdexcept>
 #include <string>
@@ -351,6 +352,82 @@ void cpu_relu(A* X, L N)
     }
 }
 
+// Counter-based random number generator. The i-th number of the stream for
+// a seed is computed directly from (seed, i), so that kernels can draw numbers
+// in any order without carrying state. The hash only uses 32-bit arithmetic,
+// which vectorizes well.
+inline uint32_t cpu_random_hash(uint32_t x)
+{
+    x ^= x >> 16;
+    x *= 0x7feb352dU;
+    x ^= x >> 15;
+    x *= 0x846ca68bU;
+    x ^= x >> 16;
+    return x;
+}
+
+inline uint32_t cpu_random_bits(uint64_t seed, uint32_t i)
+{
+    return cpu_random_hash(cpu_random_hash(i ^ static_cast<uint32_t>(seed))
+        + static_cast<uint32_t>(seed >> 32));
+}
+
+// Apply dropout to X, keeping the elements whose random bits are at least
+// threshold and multiplying them by scale. The threshold and scale come from
+// get_dropout_threshold in ops.py, so that all backends agree on them.
+// Y may be the same array as X.
+template <typename A, typename L>
+void cpu_dropout(A* Y, const A* X, uint64_t seed, uint32_t threshold, A scale, L N)
+{
+    static_assert(std::is_floating_point<A>::value,
+        "Array should be floating point");
+    static_assert(std::is_integral<L>::value, "Array length should be integral");
+
+    for (L i = 0; i < N; ++i) {
+        // Branchless, since the comparison is unpredictable by design.
+        A keep = static_cast<A>(cpu_random_bits(seed, i) >= threshold);
+        Y[i] = X[i] * (keep * scale);
+    }
+}
+
+// Draw a dropout mask with the scale of the kept elements and 0 for the
+// dropped elements. Uses the same random stream, threshold and scale as
+// cpu_dropout.
+template <typename A, typename L>
+void cpu_dropout_mask(A* mask, uint64_t seed, uint32_t threshold, A scale, L N)
+{
+    static_assert(std::is_floating_point<A>::value,
+        "Array should be floating point");
+    static_assert(std::is_integral<L>::value, "Array length should be integral");
+
+    for (L i = 0; i < N; ++i) {
+        mask[i] = static_cast<A>(cpu_random_bits(seed, i) >= threshold) * scale;
+    }
+}
+
+// Apply dropout to padded data X of shape (T, B, O), where only the first
+// size_at_t[t] sequences of time step t are valid. The valid elements get the
+// same mask as cpu_dropout would give them. The padding is zeroed without
+// drawing random numbers for it. Y may be the same array as X.
+template <typename A, typename L>
+void cpu_dropout_padded(A* Y, const A* X, const int* size_at_t, uint64_t seed,
+    uint32_t threshold, A scale, L T, L B, L O)
+{
+    static_assert(std::is_floating_point<A>::value,
+        "Array should be floating point");
+    static_assert(std::is_integral<L>::value, "Array length should be integral");
+
+    for (L t = 0; t < T; ++t) {
+        L begin = t * B * O;
+        L n_valid = std::min(static_cast<L>(std::max(size_at_t[t], 0)), B) * O;
+        for (L i = begin; i < begin + n_valid; ++i) {
+            A keep = static_cast<A>(cpu_random_bits(seed, i) >= threshold);
+            Y[i] = X[i] * (keep * scale);
+        }
+        std::fill(Y + begin + n_valid, Y + begin + B * O, static_cast<A>(0));
+    }
+}
+
 template <typename A, typename L>
 void seq2col(A* output, const A* X, const L* lengths, L nW, L B, L I, L nL)
 {
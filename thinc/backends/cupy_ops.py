@@ -14,7 +14,7 @@ from ..util import (
 )
 from . import _custom_kernels
 from .numpy_ops import NumpyOps
-from .ops import Ops
+from .ops import Ops, _check_size_at_t, draw_seed, get_dropout_threshold
 
 
 @registry.ops("CupyOps")
@@ -67,6 +67,51 @@ class CupyOps(Ops):
         else:
             return super().backprop_gelu(dY, X, inplace=inplace)
 
+    def seeded_dropout_forward(self, X, drop, seed=None):
+        if X.dtype in ("float32", "float64"):
+            if seed is None:
+                seed = draw_seed()
+            threshold, scale = get_dropout_threshold(drop)
+            Y = seeded_dropout_kernel(
+                X, numpy.uint64(seed), threshold, X.dtype.type(scale)
+            )
+            return Y, seed
+        else:
+            return super().seeded_dropout_forward(X, drop, seed)
+
+    def seeded_dropout_backward(self, dY, drop, seed, inplace=False):
+        if not inplace:
+            dX, _ = self.seeded_dropout_forward(dY, drop, seed)
+            return dX
+        elif dY.dtype in ("float32", "float64"):
+            threshold, scale = get_dropout_threshold(drop)
+            return seeded_dropout_kernel(
+                dY, numpy.uint64(seed), threshold, dY.dtype.type(scale), dY
+            )
+        else:
+            return super().seeded_dropout_backward(dY, drop, seed, inplace)
+
+    def seeded_dropout_padded_forward(self, X, size_at_t, drop, seed=None):
+        if X.dtype in ("float32", "float64"):
+            if seed is None:
+                seed = draw_seed()
+            Y = self.alloc(X.shape, dtype=X.dtype, zeros=False)
+            _dropout_padded(X, size_at_t, drop, seed, Y)
+            return Y, seed
+        else:
+            return super().seeded_dropout_padded_forward(X, size_at_t, drop, seed)
+
+    def seeded_dropout_padded_backward(self, dY, size_at_t, drop, seed, inplace=False):
+        if not inplace:
+            dX, _ = self.seeded_dropout_padded_forward(dY, size_at_t, drop, seed)
+            return dX
+        elif dY.dtype in ("float32", "float64"):
+            return _dropout_padded(dY, size_at_t, drop, seed, dY)
+        else:
+            return super().seeded_dropout_padded_backward(
+                dY, size_at_t, drop, seed, inplace
+            )
+
     def gemm(self, x, y, out=None, trans1=False, trans2=False):
         if isinstance(x, numpy.ndarray) or isinstance(y, numpy.ndarray):
             raise ValueError(
@@ -347,6 +392,23 @@ class CupyOps(Ops):
         return self.asarray(positions)
 
 
+# See cpu_random_bits in cpu_kernels.hh.
+DROPOUT_RANDOM_BITS = """
+__device__ unsigned int dropout_random_hash(unsigned int x) {
+    x ^= x >> 16;
+    x *= 0x7feb352dU;
+    x ^= x >> 15;
+    x *= 0x846ca68bU;
+    x ^= x >> 16;
+    return x;
+}
+
+__device__ unsigned int dropout_random_bits(unsigned long long seed, unsigned int i) {
+    return dropout_random_hash(dropout_random_hash(i ^ (unsigned int)seed)
+        + (unsigned int)(seed >> 32));
+}
+"""
+
 if cupy is not None:
     adam_kernel = cupy.ElementwiseKernel(
         "T grad, T lr, T one_minus_beta1, T one_minus_beta2, T eps",
@@ -356,8 +418,48 @@ if cupy is not None:
         param -= lr * m / (sqrt(v) + eps);""",
         "adam",
     )
+    # The dropout kernels draw random numbers with the same counter-based
+    # generator as the CPU kernels, so that the mask can be generated and
+    # applied in a single pass.
+    seeded_dropout_kernel = cupy.ElementwiseKernel(
+        "T x, uint64 seed, uint32 threshold, T scale",
+        "T y",
+        "y = x * ((T)(dropout_random_bits(seed, i) >= threshold) * scale);",
+        "seeded_dropout",
+        preamble=DROPOUT_RANDOM_BITS,
+    )
+    # Only the valid cells of padded data draw random numbers. Cell (t, b)
+    # is valid if b < size_at_t[t].
+    seeded_dropout_padded_kernel = cupy.ElementwiseKernel(
+        "T x, raw int32 size_at_t, int64 B, int64 O, uint64 seed, uint32 threshold, T scale",
+        "T y",
+        """long long t = i / (B * O);
+        long long b = (i / O) % B;
+        y = b < size_at_t[t]
+            ? x * ((T)(dropout_random_bits(seed, i) >= threshold) * scale)
+            : (T)0;""",
+        "seeded_dropout_padded",
+        preamble=DROPOUT_RANDOM_BITS,
+    )
 else:
     adam_kernel = None
+    seeded_dropout_kernel = None
+    seeded_dropout_padded_kernel = None
+
+
+def _dropout_padded(X, size_at_t, drop, seed, out):
+    _check_size_at_t(X, size_at_t)
+    threshold, scale = get_dropout_threshold(drop)
+    return seeded_dropout_padded_kernel(
+        X,
+        cupy.asarray(size_at_t, dtype="int32"),
+        X.shape[1],
+        X.shape[2],
+        numpy.uint64(seed),
+        threshold,
+        X.dtype.type(scale),
+        out,
+    )
 
 
 def _check_compatible_shape(u, v):
@@ -1,3 +1,5 @@
+from libc.stdint cimport uint32_t, uint64_t
+
 from .cblas cimport saxpy_ptr
 
 ctypedef double[:, ::1] double2d_t
@@ -44,6 +46,10 @@ cdef extern from "cpu_kernels.hh":
     void cpu_backprop_reduce_sum[A, L](A* dX__to, const A* d_sums__bo, const L* lengths__b,
         L B, L T, L O)
     void cpu_relu[A, L](A* X, L N)
+    void cpu_dropout[A, L](A* Y, const A* X, uint64_t seed, uint32_t threshold, A scale, L N)
+    void cpu_dropout_mask[A, L](A* mask, uint64_t seed, uint32_t threshold, A scale, L N)
+    void cpu_dropout_padded[A, L](A* Y, const A* X, const int* size_at_t, uint64_t seed,
+        uint32_t threshold, A scale, L T, L B, L O)
     void backprop_seq2col[A, L](A* d_seqs, const A* d_cols, const L* lengths, L B, L I, L nW, L nL)
     void seq2col[A, L](A* output, const A* X, const L* lengths, L nW, L B, L I, L nL)
     void cpu_gather_add[F, I, L](axpy[F].ptr axpy, F* out_bo, const F* table_to, const I* indices_bk,
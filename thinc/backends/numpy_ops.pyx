@@ -24,7 +24,7 @@ from ..util import copy_array, get_array_module
 from .cblas cimport CBlas, daxpy, saxpy
 from .linalg cimport Vec, VecVec
 
-from .ops import Ops
+from .ops import Ops, _check_size_at_t, draw_seed, get_dropout_threshold
 
 try:
     import blis.py
@@ -116,6 +116,65 @@ class NumpyOps(Ops):
         else:
             return super().relu(X, inplace=inplace)
 
+    def get_dropout_mask(self, shape, drop):
+        cdef np.ndarray mask
+        # Don't draw a seed when no random numbers are needed, so that callers
+        # passing a rate of 0 leave the random state alone.
+        if drop is None or drop <= 0:
+            return numpy.ones(shape, dtype="float32")
+        elif drop >= 1.0:
+            return numpy.zeros(shape, dtype="float32")
+        mask = numpy.empty(shape, dtype="float32")
+        threshold, scale = get_dropout_threshold(drop)
+
+        # Draw, compare and scale in a single pass over the mask.
+        cpu_dropout_mask(<float*>mask.data, <uint64_t>draw_seed(),
+            <uint32_t>threshold, <float>scale, <int>mask.size)
+        return mask
+
+    def seeded_dropout_forward(self, np.ndarray X, drop, seed=None):
+        cdef np.ndarray Y
+
+        if X.dtype == "float32" or X.dtype == "float64":
+            if seed is None:
+                seed = draw_seed()
+            X = self.as_contig(X)
+            Y = numpy.empty_like(X)
+            _dropout(Y, X, drop, seed)
+            return Y, seed
+        else:
+            return super().seeded_dropout_forward(X, drop, seed)
+
+    def seeded_dropout_backward(self, np.ndarray dY, drop, seed, inplace=False):
+        if not inplace:
+            dX, _ = self.seeded_dropout_forward(dY, drop, seed)
+            return dX
+        elif (dY.dtype == "float32" or dY.dtype == "float64") and dY.flags.c_contiguous:
+            _dropout(dY, dY, drop, seed)
+            return dY
+        else:
+            return super().seeded_dropout_backward(dY, drop, seed, inplace)
+
+    def seeded_dropout_padded_forward(self, np.ndarray X, size_at_t, drop, seed=None):
+        if X.dtype != "float32" and X.dtype != "float64":
+            return super().seeded_dropout_padded_forward(X, size_at_t, drop, seed)
+        if seed is None:
+            seed = draw_seed()
+        X = self.as_contig(X)
+        Y = numpy.empty_like(X)
+        _dropout_padded(Y, X, size_at_t, drop, seed)
+        return Y, seed
+
+    def seeded_dropout_padded_backward(self, np.ndarray dY, size_at_t, drop, seed, inplace=False):
+        if not inplace:
+            dX, _ = self.seeded_dropout_padded_forward(dY, size_at_t, drop, seed)
+            return dX
+        elif (dY.dtype == "float32" or dY.dtype == "float64") and dY.flags.c_contiguous:
+            _dropout_padded(dY, dY, size_at_t, drop, seed)
+            return dY
+        else:
+            return super().seeded_dropout_padded_backward(dY, size_at_t, drop, seed, inplace)
+
     def backprop_relu(self, np.ndarray dY, np.ndarray Y, inplace=False):
         _check_compatible_shape(dY, Y)
 
@@ -1158,6 +1217,32 @@ def _check_compatible_shape(u: np.ndarray, v: np.ndarray):
         raise ValueError(msg)
 
 
+def _dropout(np.ndarray Y, np.ndarray X, drop, seed):
+    threshold, scale = get_dropout_threshold(drop)
+    if X.dtype == "float32":
+        cpu_dropout(<float*>Y.data, <float*>X.data, <uint64_t>seed,
+            <uint32_t>threshold, <float>scale, <int>X.size)
+    else:
+        cpu_dropout(<double*>Y.data, <double*>X.data, <uint64_t>seed,
+            <uint32_t>threshold, <double>scale, <int>X.size)
+
+
+def _dropout_padded(np.ndarray Y, np.ndarray X, size_at_t, drop, seed):
+    cdef np.ndarray sizes
+    cdef int T, B, O
+
+    _check_size_at_t(X, size_at_t)
+    T, B, O = X.shape[0], X.shape[1], X.shape[2]
+    sizes = numpy.ascontiguousarray(size_at_t, dtype="int32")
+    threshold, scale = get_dropout_threshold(drop)
+    if X.dtype == "float32":
+        cpu_dropout_padded(<float*>Y.data, <float*>X.data, <int*>sizes.data,
+            <uint64_t>seed, <uint32_t>threshold, <float>scale, T, B, O)
+    else:
+        cpu_dropout_padded(<double*>Y.data, <double*>X.data, <int*>sizes.data,
+            <uint64_t>seed, <uint32_t>threshold, <double>scale, T, B, O)
+
+
 cdef inline np.ndarray _inplace_or_copy(np.ndarray X, inplace):
     if inplace:
         return X
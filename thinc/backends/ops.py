@@ -2,6 +2,7 @@ import itertools
 import math
 from typing import (
     Any,
+    Callable,
     Iterator,
     List,
     Optional,
@@ -271,6 +272,7 @@ class Ops:
         dtype: Optional[DTypes] = None,
         pad: int = 0,
         ndim_if_empty: int = 2,
+        round_to: int = 1,
     ) -> Floats2d:
         ...
 
@@ -281,6 +283,7 @@ class Ops:
         dtype: Optional[DTypes] = None,
         pad: int = 0,
         ndim_if_empty: int = 2,
+        round_to: int = 1,
     ) -> Ints1d:
         ...
 
@@ -291,6 +294,7 @@ class Ops:
         dtype: Optional[DTypes] = None,
         pad: int = 0,
         ndim_if_empty: int = 2,
+        round_to: int = 1,
     ) -> Array2d:
         ...
 
@@ -303,6 +307,7 @@ class Ops:
         dtype: Optional[DTypes] = None,
         pad: int = 0,
         ndim_if_empty: int = 2,
+        round_to: int = 1,
     ) -> ArrayXd:
         ...
 
@@ -313,6 +318,7 @@ class Ops:
         dtype: Optional[DTypes] = None,
         pad: int = 0,
         ndim_if_empty: int = 2,
+        round_to: int = 1,
     ) -> ArrayXd:
         ...
 
@@ -322,8 +328,16 @@ class Ops:
         dtype: Optional[DTypes] = None,
         pad: int = 0,
         ndim_if_empty: int = 2,
+        round_to: int = 1,
     ) -> ArrayXd:
-        """Flatten a list of arrays into one large array."""
+        """Flatten a list of arrays into one large array. If `round_to` is
+        greater than 1, zero rows are added at the end to make the number of
+        rows a multiple of it. `unflatten` ignores these rows.
+        """
+        if round_to < 1:
+            raise ValueError(
+                f"Rounding for flattening must at least be 1, was: {round_to}"
+            )
         if X is None or len(X) == 0:
             return self.alloc((0,) * ndim_if_empty, dtype=dtype or "f")
         xp = get_array_module(X[0])
@@ -338,39 +352,77 @@ class Ops:
                 padded.append(x)
             padded.append(xp.zeros((pad,) + x.shape[1:], dtype=x.dtype))
             X = padded
+        n_extra = -sum(len(x) for x in X) % round_to
+        if n_extra:
+            # Add the rows to the list, so that they're written by the same
+            # concatenation rather than by copying the result again.
+            X = list(X) + [xp.zeros((n_extra,) + X[0].shape[1:], dtype=X[0].dtype)]
         result = xp.concatenate(X)
         if dtype is not None:
             result = xp.asarray(result, dtype=dtype)
         return result
 
     @overload
-    def unflatten(self, X: Floats2d, lengths: Ints1d, pad: int = 0) -> List[Floats2d]:
+    def unflatten(
+        self,
+        X: Floats2d,
+        lengths: Ints1d,
+        pad: int = 0,
+        offsets: Optional[Sequence[int]] = None,
+    ) -> List[Floats2d]:
         ...
 
     @overload
-    def unflatten(self, X: Ints1d, lengths: Ints1d, pad: int = 0) -> List[Ints1d]:
+    def unflatten(
+        self,
+        X: Ints1d,
+        lengths: Ints1d,
+        pad: int = 0,
+        offsets: Optional[Sequence[int]] = None,
+    ) -> List[Ints1d]:
         ...
 
     @overload
-    def unflatten(self, X: Array2d, lengths: Ints1d, pad: int = 0) -> List2d:
+    def unflatten(
+        self,
+        X: Array2d,
+        lengths: Ints1d,
+        pad: int = 0,
+        offsets: Optional[Sequence[int]] = None,
+    ) -> List2d:
         ...
 
     # further specific typed signatures can be added as necessary
 
     @overload
-    def unflatten(self, X: ArrayXd, lengths: Ints1d, pad: int = 0) -> ListXd:
+    def unflatten(
+        self,
+        X: ArrayXd,
+        lengths: Ints1d,
+        pad: int = 0,
+        offsets: Optional[Sequence[int]] = None,
+    ) -> ListXd:
         ...
 
-    def unflatten(self, X: ArrayXd, lengths: Ints1d, pad: int = 0) -> ListXd:
+    def unflatten(
+        self,
+        X: ArrayXd,
+        lengths: Ints1d,
+        pad: int = 0,
+        offsets: Optional[Sequence[int]] = None,
+    ) -> ListXd:
         """The reverse/backward operation of the `flatten` function: unflatten
         a large array into a list of arrays according to the given lengths.
+        The rows at which the arrays end in X, including the padding, can be
+        passed as `offsets` to avoid computing them from the lengths again.
         """
-        # cupy.split requires lengths to be in CPU memory.
-        lengths = to_numpy(lengths)
-
-        if pad > 0:
-            lengths = numpy.where(lengths > 0, lengths + pad, 0)  # type: ignore
-        unflat = self.xp.split(X, numpy.cumsum(lengths))[:-1]  # type: ignore
+        if offsets is None:
+            # cupy.split requires lengths to be in CPU memory.
+            lengths = to_numpy(lengths)
+            if pad > 0:
+                lengths = numpy.where(lengths > 0, lengths + pad, 0)  # type: ignore
+            offsets = numpy.cumsum(lengths)  # type: ignore
+        unflat = self.xp.split(X, offsets)[:-1]  # type: ignore
         if pad > 0:
             unflat = [a[pad:] for a in unflat]
 
@@ -447,14 +499,12 @@ class Ops:
         nS = max([seq.shape[0] for seq in seqs])
         nB = len(seqs)
         nO = seqs[0].shape[1]
-        # Reorder the sequences, by length. This looks the same in either
-        # direction: you're swapping elements between their original and sorted
-        # position.
-        seqs = cast(List2d, [seqs[i] for i in indices_])
-        arr: Array3d = self.pad(seqs)
-        assert arr.shape == (nB, nS, nO), (nB, nS, nO)
-        arr = self.as_contig(arr.transpose((1, 0, 2)))
-        assert arr.shape == (nS, nB, nO)
+        # Write the rows straight into their time-major (nS, nB, nO) position,
+        # instead of padding batch-major and then copying into a transpose.
+        arr = cast(Array3d, self.alloc((nS, nB, nO), dtype=seqs[0].dtype))
+        rows = _get_padded_rows([len(seq) for seq in seqs], indices_, nB)
+        arr2d = arr.reshape((nS * nB, nO))
+        arr2d[self.asarray1i(rows)] = self.xp.concatenate(seqs)
         # Build a lookup table so we can find how big the batch is at point t.
         batch_size_at_t_ = [0 for _ in range(nS)]
         current_size = len(lengths_)
@@ -475,11 +525,18 @@ class Ops:
         data = padded.data
         indices = to_numpy(padded.indices)
         lengths = to_numpy(padded.lengths)
-        unpadded: List[Optional[Array2d]] = [None] * len(lengths)
-        # Transpose from (length, batch, data) to (batch, length, data)
-        data = self.as_contig(data.transpose((1, 0, 2)))
-        for i in range(data.shape[0]):
-            unpadded[indices[i]] = data[i, : int(lengths[i])]
+        nS, nB, nO = data.shape
+        if not nB:
+            return cast(List2d, [])
+        # Only copy out the rows that aren't padding, in the original order of
+        # the sequences. The outputs are views into this array.
+        orig_lengths = numpy.zeros((nB,), dtype="i")
+        orig_lengths[indices] = lengths
+        rows = _get_padded_rows(orig_lengths, indices, nB)
+        flat = data.reshape((nS * nB, nO))[self.asarray1i(rows)]  # type: ignore[index]
+        ends = numpy.cumsum(orig_lengths)
+        starts = ends - orig_lengths
+        unpadded = [flat[start:end] for start, end in zip(starts, ends)]
         return cast(List2d, unpadded)
 
     def get_dropout_mask(self, shape: Shape, drop: Optional[float]) -> FloatsXd:
@@ -496,6 +553,108 @@ class Ops:
         mask = (coinflips >= drop) / (1.0 - drop)
         return cast(FloatsXd, self.asarray(mask, dtype="float32"))
 
+    def dropout(
+        self,
+        X: FloatsXd,
+        drop: Optional[float],
+        *,
+        size_at_t: Optional[Ints1d] = None,
+        inplace_backward: bool = False,
+    ) -> Tuple[FloatsXd, Callable[[FloatsXd], FloatsXd]]:
+        """Apply dropout to X, returning the output and a callback to compute
+        the gradient. The callback only keeps the seed of the mask, which it
+        regenerates with `seeded_dropout_backward`, so backends can change how
+        dropout is done by overriding this method or the seeded methods. If
+        `size_at_t` is given, X is padded data and the padding is zeroed, like
+        with `seeded_dropout_padded_forward`. With `inplace_backward`, the
+        callback writes the gradient into the array it is given.
+        """
+        if size_at_t is not None:
+            sizes: Ints1d = size_at_t
+            Y3d, seed = self.seeded_dropout_padded_forward(
+                cast(Floats3d, X), sizes, drop
+            )
+
+            def backprop_padded(dY: FloatsXd) -> FloatsXd:
+                return self.seeded_dropout_padded_backward(
+                    cast(Floats3d, dY), sizes, drop, seed, inplace_backward
+                )
+
+            return Y3d, backprop_padded
+
+        Y, seed = self.seeded_dropout_forward(X, drop)
+
+        def backprop(dY: FloatsXd) -> FloatsXd:
+            return self.seeded_dropout_backward(dY, drop, seed, inplace_backward)
+
+        return Y, backprop
+
+    def seeded_dropout_forward(
+        self, X: FloatsXd, drop: Optional[float], seed: Optional[int] = None
+    ) -> Tuple[FloatsXd, int]:
+        """Apply dropout to X with a mask that is generated from `seed` by a
+        counter-based random number generator. Instead of the mask, only the
+        seed needs to be kept to compute the gradient: the backward pass
+        regenerates the same mask. If no seed is given, a new one is drawn.
+        Returns the output and the seed.
+        """
+        if seed is None:
+            seed = draw_seed()
+        threshold, scale = get_dropout_threshold(drop)
+        keep = _random_bits(self, seed, X.size).reshape(X.shape) >= threshold
+        return cast(FloatsXd, X * self.asarray(keep, dtype=X.dtype) * scale), seed
+
+    def seeded_dropout_backward(
+        self, dY: FloatsXd, drop: Optional[float], seed: int, inplace: bool = False
+    ) -> FloatsXd:
+        """Compute the gradient of `seeded_dropout_forward`, given the seed it
+        returned. With `inplace`, the gradient is written into dY.
+        """
+        if not inplace:
+            dX, _ = self.seeded_dropout_forward(dY, drop, seed)
+            return dX
+        threshold, scale = get_dropout_threshold(drop)
+        keep = _random_bits(self, seed, dY.size).reshape(dY.shape) >= threshold
+        dY *= self.asarray(keep, dtype=dY.dtype) * scale
+        return dY
+
+    def seeded_dropout_padded_forward(
+        self,
+        X: Floats3d,
+        size_at_t: Ints1d,
+        drop: Optional[float],
+        seed: Optional[int] = None,
+    ) -> Tuple[Floats3d, int]:
+        """Apply dropout to padded data like `seeded_dropout_forward`, where
+        only the first `size_at_t[t]` sequences of time step t are valid. The
+        valid elements get the same mask as with `seeded_dropout_forward`. The
+        padding is zeroed, so backends can skip drawing random numbers for it.
+        Returns the output and the seed.
+        """
+        _check_size_at_t(X, size_at_t)
+        Y, seed = self.seeded_dropout_forward(X, drop, seed)
+        Y *= _get_padded_mask(self, size_at_t, X.shape[1])
+        return cast(Floats3d, Y), seed
+
+    def seeded_dropout_padded_backward(
+        self,
+        dY: Floats3d,
+        size_at_t: Ints1d,
+        drop: Optional[float],
+        seed: int,
+        inplace: bool = False,
+    ) -> Floats3d:
+        """Compute the gradient of `seeded_dropout_padded_forward`, given the
+        seed it returned. With `inplace`, the gradient is written into dY.
+        """
+        if not inplace:
+            dX, _ = self.seeded_dropout_padded_forward(dY, size_at_t, drop, seed)
+            return dX
+        _check_size_at_t(dY, size_at_t)
+        dY = cast(Floats3d, self.seeded_dropout_backward(dY, drop, seed, inplace))
+        dY *= _get_padded_mask(self, size_at_t, dY.shape[1])
+        return dY
+
     def alloc1f(
         self,
         d0: int,
@@ -1690,6 +1849,74 @@ def dtanh(Y: ArrayT) -> ArrayT:
     return 1 - Y**2
 
 
+def _get_padded_rows(lengths, indices, nB: int) -> Ints1d:
+    """Find the row of a flattened (nS * nB, nO) padded array that each row of
+    the concatenated sequences is stored in. `lengths` gives the length of
+    each sequence in its original order, and `indices` the original index of
+    the sequence at each position of the batch.
+    """
+    lengths = numpy.asarray(lengths, dtype="i")
+    batch_pos = numpy.empty((nB,), dtype="i")
+    batch_pos[numpy.asarray(indices, dtype="i")] = numpy.arange(nB, dtype="i")
+    seq_ids = numpy.repeat(numpy.arange(nB, dtype="i"), lengths)
+    starts = numpy.cumsum(lengths) - lengths
+    t = numpy.arange(seq_ids.size, dtype="i") - starts[seq_ids]
+    return cast(Ints1d, t * nB + batch_pos[seq_ids])
+
+
+def _check_size_at_t(X: Floats3d, size_at_t: Ints1d) -> None:
+    if X.ndim != 3 or size_at_t.shape != (X.shape[0],):
+        raise ValueError(
+            f"size_at_t of shape {size_at_t.shape} doesn't match padded data of shape {X.shape}"
+        )
+
+
+def _get_padded_mask(ops: Ops, size_at_t: Ints1d, nB: int):
+    """Get a (T, B, 1) mask that is 1 for the valid cells of padded data."""
+    sizes = ops.xp.asarray(size_at_t)
+    return (ops.xp.arange(nB)[None, :] < sizes[:, None])[:, :, None]
+
+
+def draw_seed() -> int:
+    """Draw a seed for the counter-based random number generators used by
+    the custom kernels. The seed comes from numpy's global random state, so
+    that `fix_random_seed` makes the kernels reproducible too.
+    """
+    return int(numpy.random.randint(0, 2**64, dtype="uint64"))
+
+
+def get_dropout_threshold(drop: Optional[float]) -> Tuple[numpy.uint32, float]:
+    """Get the threshold on the random bits above which an element is kept by
+    the seeded dropout kernels, and the scale of the kept elements.
+    """
+    rate = drop if drop is not None else 0.0
+    if rate <= 0.0:
+        return numpy.uint32(0), 1.0
+    threshold = numpy.uint32(min(math.ceil(rate * 2**32), 2**32 - 1))
+    # With rate >= 1 the output is zeroed through the scale.
+    return threshold, 1.0 / (1.0 - rate) if rate < 1.0 else 0.0
+
+
+def _random_hash(x):
+    x ^= x >> 16
+    x *= numpy.uint32(0x7FEB352D)
+    x ^= x >> 15
+    x *= numpy.uint32(0x846CA68B)
+    x ^= x >> 16
+    return x
+
+
+def _random_bits(ops: Ops, seed: int, size: int):
+    """Counter-based random number generator matching `cpu_random_bits` in
+    cpu_kernels.hh: compute the first `size` numbers of the stream for `seed`.
+    """
+    x = ops.xp.arange(size, dtype="uint32")
+    x ^= numpy.uint32(seed & 0xFFFFFFFF)
+    x = _random_hash(x)
+    x += numpy.uint32(seed >> 32)
+    return _random_hash(x)
+
+
 def gaussian_cdf(ops: Ops, X: FloatsXdT) -> FloatsXdT:
     """Gaussian CDF for distribution with mean 0 and stdev 1."""
     return 0.5 * (1.0 + ops.erf(INV_SQRT2 * X))
@@ -1,11 +1,15 @@
-from typing import Callable, List, Sequence, Tuple, TypeVar, Union, cast
+from itertools import accumulate
+from typing import Callable, Dict, List, Sequence, Tuple, TypeVar, Union, cast
 
 from ..config import registry
 from ..model import Model
-from ..types import ArrayXd, Padded, Ragged
+from ..types import ArrayXd, Floats3d, FloatsXd, Padded, Ragged, Shape
 
 InT = TypeVar("InT", bound=Union[ArrayXd, Sequence[ArrayXd], Ragged, Padded])
 
+# Dropout functions by input type, filled in as new types are seen.
+_DROPOUT_IMPLS: Dict[type, Callable] = {}
+
 
 @registry.layers("Dropout.v1")
 def Dropout(rate: float = 0.0) -> Model[InT, InT]:
@@ -13,75 +17,115 @@ def Dropout(rate: float = 0.0) -> Model[InT, InT]:
     during training.  Specifically, cells of the input are zeroed with
     probability determined by the `rate` argument.
     """
-    return Model("dropout", forward, attrs={"dropout_rate": rate, "is_enabled": True})
+    return Model(
+        "dropout",
+        forward,
+        attrs={"dropout_rate": rate, "is_enabled": True, "is_pointwise": True},
+    )
 
 
 def forward(model: Model[InT, InT], X: InT, is_train: bool) -> Tuple[InT, Callable]:
-    rate = model.attrs["dropout_rate"]
-    is_enabled = model.attrs["is_enabled"] and is_train
-    if rate == 0 or not is_enabled:
-        return X, lambda dY: dY
-    elif isinstance(X, Ragged):
-        data_r, backprop = _dropout_ragged(model, X, is_train)
-        return cast(InT, data_r), backprop
+    # Check is_train first, so that prediction only costs a single branch.
+    if not is_train:
+        return X, _backprop_identity
+    attrs = model.attrs
+    if attrs["dropout_rate"] == 0 or not attrs["is_enabled"]:
+        return X, _backprop_identity
+    impl = _DROPOUT_IMPLS.get(type(X))
+    if impl is None:
+        impl = _get_dropout_impl(X)
+    return cast(Tuple[InT, Callable], impl(model, X, is_train))
+
+
+def _backprop_identity(dY: InT) -> InT:
+    return dY
+
+
+def _get_dropout_impl(X: InT) -> Callable:
+    """Find the dropout function for the type of the input, and remember it so
+    that later calls with the same type can skip the isinstance checks.
+    """
+    impl: Callable
+    if isinstance(X, Ragged):
+        impl = _dropout_ragged
     elif isinstance(X, Padded):
-        data_p, backprop = _dropout_padded(model, X, is_train)
-        return cast(InT, data_p), backprop
+        impl = _dropout_padded
     elif isinstance(X, Sequence):
-        data_l, backprop = _dropout_lists(model, X, is_train)
-        return cast(InT, data_l), backprop
+        impl = _dropout_lists
     else:
-        data_a, backprop = _dropout_array(model, cast(ArrayXd, X), is_train)
-        return cast(InT, data_a), backprop
+        impl = _dropout_array
+    _DROPOUT_IMPLS[type(X)] = impl
+    return impl
 
 
 def _dropout_array(
     model: Model[InT, InT], X: ArrayXd, is_train: bool
 ) -> Tuple[ArrayXd, Callable]:
-    rate = model.attrs["dropout_rate"]
-    mask = model.ops.get_dropout_mask(X.shape, rate)
-
-    def backprop(dY: ArrayXd) -> ArrayXd:
-        return dY * mask
-
-    return cast(ArrayXd, X * mask), backprop
+    Y, backprop = model.ops.dropout(cast(FloatsXd, X), model.attrs["dropout_rate"])
+    return cast(ArrayXd, Y), backprop
 
 
 def _dropout_padded(
     model: Model[InT, InT], Xp: Padded, is_train: bool
 ) -> Tuple[Padded, Callable]:
-    X = Xp.data
-    mask = model.ops.get_dropout_mask(X.shape, model.attrs["dropout_rate"])
-    Y = X * mask
+    rate = model.attrs["dropout_rate"]
+    size_at_t = Xp.size_at_t
+    # Skip the padding, which is zeroed instead of drawing random numbers.
+    Y, get_dX = model.ops.dropout(cast(Floats3d, Xp.data), rate, size_at_t=size_at_t)
 
     def backprop(dYp: Padded) -> Padded:
-        return Padded(dYp.data * mask, dYp.size_at_t, dYp.lengths, dYp.indices)
+        dX = get_dX(cast(Floats3d, dYp.data))
+        return Padded(cast(Floats3d, dX), dYp.size_at_t, dYp.lengths, dYp.indices)
 
-    return Padded(Y, Xp.size_at_t, Xp.lengths, Xp.indices), backprop
+    return Padded(cast(Floats3d, Y), size_at_t, Xp.lengths, Xp.indices), backprop
 
 
 def _dropout_ragged(
     model: Model[InT, InT], Xr: Ragged, is_train: bool
 ) -> Tuple[Ragged, Callable]:
-    X = Xr.data
-    lengths = Xr.lengths
-    mask = model.ops.get_dropout_mask(X.shape, model.attrs["dropout_rate"])
-    Y = X * mask
+    rate = model.attrs["dropout_rate"]
+    Y, get_dX = model.ops.dropout(cast(FloatsXd, Xr.data), rate)
 
     def backprop(dYr: Ragged) -> Ragged:
-        return Ragged(dYr.data * mask, dYr.lengths)
+        return Ragged(get_dX(cast(FloatsXd, dYr.data)), dYr.lengths)
 
-    return Ragged(Y, lengths), backprop
+    return Ragged(Y, Xr.lengths), backprop
 
 
 def _dropout_lists(
     model: Model[InT, InT], Xs: Sequence[ArrayXd], is_train: bool
 ) -> Tuple[Sequence[ArrayXd], Callable]:
+    ops = model.ops
     rate = model.attrs["dropout_rate"]
-    masks = [model.ops.get_dropout_mask(X.shape, rate) for X in Xs]
-    Ys = [X * mask for X, mask in zip(Xs, masks)]
+    if not Xs:
+        return [], _backprop_identity
+    xp = ops.xp
+    shapes = [X.shape for X in Xs]
+    # Apply dropout to all the items in one go, then give back views into the
+    # flat result. The items can have different shapes, so flatten each one
+    # fully instead of stacking along the first axis.
+    ends = list(accumulate(X.size for X in Xs))
+    starts = [0] + ends[:-1]
+    flat = xp.concatenate([X.ravel() for X in Xs])
+    # The concatenated gradient is our own copy, so it can be overwritten.
+    # The other variants mustn't do this, as the caller may still need dY
+    # (e.g. residual adds it to the gradient of its input).
+    Y, get_dX = ops.dropout(cast(FloatsXd, flat), rate, inplace_backward=True)
 
     def backprop(dYs: List[ArrayXd]) -> List[ArrayXd]:
-        return [dY * mask for dY, mask in zip(dYs, masks)]
-
-    return Ys, backprop
+        dY = xp.concatenate([dY.ravel() for dY in dYs])
+        return _split_flat(get_dX(dY), starts, ends, shapes)
+
+    return _split_flat(Y, starts, ends, shapes), backprop
+
+
+def _split_flat(
+    flat: FloatsXd,
+    starts: List[int],
+    ends: List[int],
+    shapes: Sequence[Shape],
+) -> List[ArrayXd]:
+    return [
+        cast(ArrayXd, flat[start:end].reshape(shape))
+        for start, end, shape in zip(starts, ends, shapes)
+    ]
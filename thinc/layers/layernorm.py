@@ -17,6 +17,7 @@ def LayerNorm(nI: Optional[int] = None) -> Model[InT, InT]:
         init=init,
         dims={"nI": nI, "nO": nI},
         params={"G": None, "b": None},
+        attrs={"is_pointwise": True},
     )
 
 
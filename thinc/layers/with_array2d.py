@@ -1,9 +1,10 @@
-from typing import Callable, List, Optional, Tuple, TypeVar, Union, cast
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from ..backends import NumpyOps
 from ..config import registry
 from ..model import Model
-from ..types import Array2d, Floats2d, List2d, Padded, Ragged
+from ..types import Array2d, Floats3d, List2d, Padded, Ragged
 
 NUMPY_OPS = NumpyOps()
 
@@ -11,19 +12,31 @@ NUMPY_OPS = NumpyOps()
 ValT = TypeVar("ValT", bound=Array2d)
 SeqT = TypeVar("SeqT", bound=Union[Padded, Ragged, List2d, Array2d])
 
+# Forward functions by input type, filled in as new types are seen.
+_FORWARD_IMPLS: Dict[type, Callable] = {}
+
 
 @registry.layers("with_array2d.v1")
-def with_array2d(layer: Model[ValT, ValT], pad: int = 0) -> Model[SeqT, SeqT]:
+def with_array2d(
+    layer: Model[ValT, ValT], pad: int = 0, round_to: int = 1
+) -> Model[SeqT, SeqT]:
     """Transform sequence data into a contiguous 2d array on the way into and
     out of a model. Handles a variety of sequence types: lists, padded and ragged.
     If the input is a 2d array, it is passed through unchanged.
+
+    With `round_to`, the array made from a list input gets zero rows appended
+    so that its length is a multiple of it. The wrapped layer must then treat
+    each row independently: a layer that mixes rows would also see the
+    appended rows, and its outputs would be wrong. Layers that set the
+    `is_pointwise` attr, like Dropout and LayerNorm, get list inputs without
+    any padding, so `pad` and `round_to` are ignored for them.
     """
     return Model(
         f"with_array({layer.name})",
         forward,
         init=init,
         layers=[layer],
-        attrs={"pad": pad},
+        attrs={"pad": pad, "round_to": round_to},
         dims={name: layer.maybe_get_dim(name) for name in layer.dim_names},
     )
 
@@ -31,15 +44,27 @@ def with_array2d(layer: Model[ValT, ValT], pad: int = 0) -> Model[SeqT, SeqT]:
 def forward(
     model: Model[SeqT, SeqT], Xseq: SeqT, is_train: bool
 ) -> Tuple[SeqT, Callable]:
+    impl = _FORWARD_IMPLS.get(type(Xseq))
+    if impl is None:
+        impl = _get_forward_impl(Xseq)
+    return cast(Tuple[SeqT, Callable], impl(model, Xseq, is_train))
+
+
+def _get_forward_impl(Xseq: SeqT) -> Callable:
+    """Find the forward function for the type of the input, and remember it so
+    that later calls with the same type can skip the isinstance checks.
+    """
+    impl: Callable
     if isinstance(Xseq, Ragged):
-        return cast(Tuple[SeqT, Callable], _ragged_forward(model, Xseq, is_train))
+        impl = _ragged_forward
     elif isinstance(Xseq, Padded):
-        return cast(Tuple[SeqT, Callable], _padded_forward(model, Xseq, is_train))
+        impl = _padded_forward
     elif not isinstance(Xseq, (list, tuple)):
-        return model.layers[0](Xseq, is_train)
+        impl = _array_forward
     else:
-        return cast(Tuple[SeqT, Callable], _list_forward(model, Xseq, is_train))
-    return
+        impl = _list_forward
+    _FORWARD_IMPLS[type(Xseq)] = impl
+    return impl
 
 
 def init(
@@ -60,8 +85,9 @@ def _get_array(model, X: SeqT) -> Array2d:
     if isinstance(X, Ragged):
         return X.data
     elif isinstance(X, Padded):
-        return model.ops.reshape2f(
-            X.data, X.data.shape[0] * X.data.shape[1], X.data.shape[2]
+        data = model.ops.as_contig(X.data)
+        return cast(
+            Array2d, data.reshape((data.shape[0] * data.shape[1], data.shape[2]))
         )
     elif not isinstance(X, (list, tuple)):
         return cast(Array2d, X)
@@ -69,21 +95,58 @@ def _get_array(model, X: SeqT) -> Array2d:
         return model.ops.flatten(X)
 
 
+def _array_forward(
+    model: Model[SeqT, SeqT], X: Array2d, is_train: bool
+) -> Tuple[Array2d, Callable]:
+    return model.layers[0](X, is_train)
+
+
 def _list_forward(
     model: Model[SeqT, SeqT], Xs: List2d, is_train: bool
 ) -> Tuple[List2d, Callable]:
     layer: Model[Array2d, Array2d] = model.layers[0]
-    pad = model.attrs["pad"]
-    lengths = NUMPY_OPS.asarray1i([len(seq) for seq in Xs])
-    Xf = layer.ops.flatten(Xs, pad=pad)
+    if layer.attrs.get("is_pointwise", False):
+        return _pointwise_list_forward(model, Xs, is_train)
+    # Assign these to locals, as they're used in both directions.
+    flatten = layer.ops.flatten
+    unflatten = layer.ops.unflatten
+    attrs = model.attrs
+    pad = attrs["pad"]
+    round_to = attrs["round_to"]
+    sizes = [len(seq) for seq in Xs]
+    lengths = NUMPY_OPS.asarray1i(sizes)
+    # Find where each sequence ends in the flattened array once, rather than
+    # in both calls to unflatten. flatten only pads non-empty sequences.
+    offsets = list(accumulate(size + pad if size else 0 for size in sizes))
+    Xf = flatten(Xs, pad=pad, round_to=round_to)
     Yf, get_dXf = layer(Xf, is_train)
 
     def backprop(dYs: List2d) -> List2d:
-        dYf = layer.ops.flatten(dYs, pad=pad)
+        dYf = flatten(dYs, pad=pad, round_to=round_to)
         dXf = get_dXf(dYf)
-        return layer.ops.unflatten(dXf, lengths, pad=pad)
+        return unflatten(dXf, lengths, pad=pad, offsets=offsets)
 
-    return layer.ops.unflatten(Yf, lengths, pad=pad), backprop
+    return unflatten(Yf, lengths, pad=pad, offsets=offsets), backprop
+
+
+def _pointwise_list_forward(
+    model: Model[SeqT, SeqT], Xs: List2d, is_train: bool
+) -> Tuple[List2d, Callable]:
+    # Layers that treat each row on its own don't need padding between the
+    # sequences. A single sequence can be passed through without a copy.
+    layer: Model[Array2d, Array2d] = model.layers[0]
+    flatten = layer.ops.flatten
+    ends = list(accumulate(len(X) for X in Xs))
+    starts = [0] + ends[:-1]
+    Xf = Xs[0] if len(Xs) == 1 else flatten(Xs)
+    Yf, get_dXf = layer(Xf, is_train)
+
+    def backprop(dYs: List2d) -> List2d:
+        dYf = dYs[0] if len(dYs) == 1 else flatten(dYs)
+        dXf = get_dXf(dYf)
+        return cast(List2d, [dXf[start:end] for start, end in zip(starts, ends)])
+
+    return cast(List2d, [Yf[start:end] for start, end in zip(starts, ends)]), backprop
 
 
 def _ragged_forward(
@@ -103,23 +166,19 @@ def _padded_forward(
     model: Model[SeqT, SeqT], Xp: Padded, is_train: bool
 ) -> Tuple[Padded, Callable]:
     layer: Model[Array2d, Array2d] = model.layers[0]
-    X = model.ops.reshape2(
-        Xp.data, Xp.data.shape[0] * Xp.data.shape[1], Xp.data.shape[2]
-    )
-    Y2d, get_dX = layer(X, is_train)
-    Y = model.ops.reshape3f(
-        cast(Floats2d, Y2d), Xp.data.shape[0], Xp.data.shape[1], Y2d.shape[1]
-    )
+    as_contig = model.ops.as_contig
+    # Make sure the data is contiguous up front, so that the reshapes between
+    # the 3d and 2d views below never need to copy.
+    X3d = as_contig(Xp.data)
+    nT, nB, nI = X3d.shape
+    Y2d, get_dX = layer(cast(Array2d, X3d.reshape((nT * nB, nI))), is_train)
+    Y = cast(Floats3d, Y2d.reshape((nT, nB, Y2d.shape[1])))
 
     def backprop(dYp: Padded) -> Padded:
         assert isinstance(dYp, Padded)
-        dY = model.ops.reshape2(
-            dYp.data, dYp.data.shape[0] * dYp.data.shape[1], dYp.data.shape[2]
-        )
-        dX2d = get_dX(dY)
-        dX = model.ops.reshape3f(
-            dX2d, dYp.data.shape[0], dYp.data.shape[1], dX2d.shape[1]
-        )
+        dY3d = as_contig(dYp.data)
+        dX2d = get_dX(dY3d.reshape((nT * nB, dY3d.shape[2])))
+        dX = cast(Floats3d, dX2d.reshape((nT, nB, dX2d.shape[1])))
         return Padded(dX, dYp.size_at_t, dYp.lengths, dYp.indices)
 
     return Padded(Y, Xp.size_at_t, Xp.lengths, Xp.indices), backprop
@@ -1,13 +1,17 @@
-from typing import Callable, List, Optional, Tuple, TypeVar, Union, cast
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
+from ..backends.ops import _get_padded_rows
 from ..config import registry
 from ..model import Model
-from ..types import Array2d, Floats3d, Ints1d, List2d, Padded, Ragged
-from ..util import is_xp_array
+from ..types import Array2d, Array3d, Floats3d, Ints1d, List2d, Padded, Ragged
+from ..util import is_xp_array, to_numpy
 
 PaddedData = Tuple[Floats3d, Ints1d, Ints1d, Ints1d]
 SeqT = TypeVar("SeqT", bound=Union[Padded, Ragged, List2d, Floats3d, PaddedData])
 
+# Forward functions by input type, filled in as new types are seen.
+_FORWARD_IMPLS: Dict[type, Callable] = {}
+
 
 @registry.layers("with_padded.v1")
 def with_padded(layer: Model[Padded, Padded]) -> Model[SeqT, SeqT]:
@@ -24,23 +28,34 @@ def forward(
     model: Model[SeqT, SeqT], Xseq: SeqT, is_train: bool
 ) -> Tuple[SeqT, Callable]:
     layer: Model[Padded, Padded] = model.layers[0]
-    if isinstance(Xseq, Padded):
-        return cast(Tuple[SeqT, Callable], layer(Xseq, is_train))
+    impl = _FORWARD_IMPLS.get(type(Xseq))
+    if impl is None:
+        impl = _get_forward_impl(Xseq)
+    return cast(Tuple[SeqT, Callable], impl(layer, Xseq, is_train))
+
+
+def _get_forward_impl(Xseq: SeqT) -> Callable:
+    """Find the forward function for the type of the input. It's remembered
+    for later calls with the same type, except for tuples: whether those are
+    padded data depends on their contents.
+    """
+    impl: Callable
+    if _is_padded_data(Xseq):
+        return _tuple_forward
+    elif isinstance(Xseq, tuple):
+        return _list_forward
+    elif isinstance(Xseq, list):
+        impl = _list_forward
+    elif isinstance(Xseq, Padded):
+        impl = _padded_forward
     elif isinstance(Xseq, Ragged):
-        return cast(Tuple[SeqT, Callable], _ragged_forward(layer, Xseq, is_train))
-    elif _is_padded_data(Xseq):
-        return cast(
-            Tuple[SeqT, Callable],
-            _tuple_forward(layer, cast(PaddedData, Xseq), is_train),
-        )
+        impl = _ragged_forward
     elif is_xp_array(Xseq):
-        return cast(
-            Tuple[SeqT, Callable], _array_forward(layer, cast(Floats3d, Xseq), is_train)
-        )
+        impl = _array_forward
     else:
-        return cast(
-            Tuple[SeqT, Callable], _list_forward(layer, cast(List2d, Xseq), is_train)
-        )
+        impl = _list_forward
+    _FORWARD_IMPLS[type(Xseq)] = impl
+    return impl
 
 
 def init(
@@ -53,7 +68,14 @@ def init(
 
 
 def _is_padded_data(seq: SeqT) -> bool:
-    return isinstance(seq, tuple) and len(seq) == 4 and all(map(is_xp_array, seq))
+    # The first item is enough to tell (data, size_at_t, lengths, indices)
+    # apart from a tuple of four 2d arrays.
+    return (
+        isinstance(seq, tuple)
+        and len(seq) == 4
+        and is_xp_array(seq[0])
+        and seq[0].ndim == 3
+    )
 
 
 def _get_padded(model: Model, seq: SeqT) -> Padded:
@@ -74,6 +96,12 @@ def _get_padded(model: Model, seq: SeqT) -> Padded:
         return model.ops.list2padded(seq)
 
 
+def _padded_forward(
+    layer: Model[Padded, Padded], Xp: Padded, is_train: bool
+) -> Tuple[Padded, Callable]:
+    return layer(Xp, is_train)
+
+
 def _array_forward(
     layer: Model[Padded, Padded], X: Floats3d, is_train
 ) -> Tuple[Floats3d, Callable]:
@@ -108,36 +136,63 @@ def _ragged_forward(
     layer: Model[Padded, Padded], Xr: Ragged, is_train: bool
 ) -> Tuple[Ragged, Callable]:
     # Assign these to locals, to keep code a bit shorter.
-    list2padded = layer.ops.list2padded
-    padded2list = layer.ops.padded2list
-    unflatten = layer.ops.unflatten
-    flatten = layer.ops.flatten
+    ops = layer.ops
+    alloc = ops.alloc
     # It's worth being a bit careful about memory here, as the activations
     # are potentially large on GPU. So we make nested function calls instead
     # of assigning to temporaries where possible, so memory can be reclaimed
     # sooner.
-    Yp, get_dXp = layer(list2padded(unflatten(Xr.data, Xr.lengths)), is_train)
+    Yp, get_dXp = layer(ops.list2padded(ops.unflatten(Xr.data, Xr.lengths)), is_train)
+    # The permutation between the ragged rows and the padded (T, B) cells is
+    # the same on the way back, so we work it out once and use it to gather
+    # the output and to scatter the gradient, instead of sorting again.
+    size_at_t = Yp.size_at_t
+    lengths = Yp.lengths
+    indices = Yp.indices
+    nT, nB = Yp.data.shape[:2]
+    # The rows are worked out on the host, as the lengths usually are.
+    rows = ops.asarray1i(_get_padded_rows(to_numpy(Xr.lengths), to_numpy(indices), nB))
 
     def backprop(dYr: Ragged):
-        flattened = flatten(
-            padded2list(get_dXp(list2padded(unflatten(dYr.data, dYr.lengths)))),
-        )
-        return Ragged(flattened, dYr.lengths)
+        dY = dYr.data
+        dYp = alloc((nT * nB, dY.shape[1]), dtype=dY.dtype)
+        dYp[rows] = dY
+        dYp = dYp.reshape((nT, nB, dY.shape[1]))
+        dXp = get_dXp(Padded(dYp, size_at_t, lengths, indices))
+        return Ragged(_gather_rows(dXp.data, rows), dYr.lengths)
 
-    flattened = flatten(padded2list(Yp))
-    return Ragged(flattened, Xr.lengths), backprop
+    return Ragged(_gather_rows(Yp.data, rows), Xr.lengths), backprop
 
 
 def _list_forward(
     layer: Model[Padded, Padded], Xs: List2d, is_train: bool
 ) -> Tuple[List2d, Callable]:
     # Assign these to locals, to keep code a bit shorter.
-    list2padded = layer.ops.list2padded
-    padded2list = layer.ops.padded2list
-
-    Yp, get_dXp = layer(list2padded(Xs), is_train)
+    ops = layer.ops
+    padded2list = ops.padded2list
+
+    Yp, get_dXp = layer(ops.list2padded(Xs), is_train)
+    # Keep the metadata, so that the backward pass can pad the gradients
+    # directly into place without sorting them again.
+    size_at_t = Yp.size_at_t
+    lengths = Yp.lengths
+    indices = Yp.indices
+    nT, nB = Yp.data.shape[:2]
+    rows = ops.asarray1i(_get_padded_rows([len(X) for X in Xs], to_numpy(indices), nB))
 
     def backprop(dYs):
-        return padded2list(get_dXp(list2padded(dYs)))
+        if not dYs:
+            dYp = ops.alloc3f(nT, nB, 0)
+        else:
+            nO = dYs[0].shape[1]
+            dYp = ops.alloc((nT * nB, nO), dtype=dYs[0].dtype)
+            dYp[rows] = ops.xp.concatenate(dYs)
+            dYp = dYp.reshape((nT, nB, nO))
+        return padded2list(get_dXp(Padded(dYp, size_at_t, lengths, indices)))
 
     return padded2list(Yp), backprop
+
+
+def _gather_rows(data: Array3d, rows: Ints1d) -> Array2d:
+    data2d = data.reshape((data.shape[0] * data.shape[1], data.shape[2]))
+    return cast(Array2d, data2d[rows])  # type: ignore[index]
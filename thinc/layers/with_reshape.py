@@ -23,16 +23,15 @@ def with_reshape(layer: Model[OutT, OutT]) -> Model[InT, InT]:
 def forward(model: Model[InT, InT], X: InT, is_train: bool) -> Tuple[InT, Callable]:
     layer = model.layers[0]
     initial_shape = X.shape
-    final_shape = list(initial_shape[:-1]) + [layer.get_dim("nO")]
-    nB = X.shape[0]
-    nT = X.shape[1]
-    X2d = model.ops.reshape(X, (-1, X.shape[2]))
+    nB, nT, nI = X.shape
+    # Make the data contiguous once, so the reshapes below are all views.
+    X2d = model.ops.as_contig(X).reshape((nB * nT, nI))
     Y2d, Y2d_backprop = layer(X2d, is_train=is_train)
-    Y = model.ops.reshape3(Y2d, *final_shape)
+    Y = Y2d.reshape((nB, nT, Y2d.shape[1]))
 
     def backprop(dY: InT) -> InT:
-        reshaped = model.ops.reshape2(dY, nB * nT, -1)
-        return Y2d_backprop(model.ops.reshape3(reshaped, *initial_shape))
+        dY2d = model.ops.as_contig(dY).reshape((nB * nT, dY.shape[2]))
+        return cast(InT, Y2d_backprop(dY2d).reshape(initial_shape))
 
     return cast(InT, Y), backprop
 
@@ -213,6 +213,145 @@ def test_get_dropout_not_empty(ops):
     assert mask.shape == shape
 
 
+@pytest.mark.parametrize("ops", XP_OPS)
+@pytest.mark.parametrize("drop", [None, -0.5, 0.0, 0.25, 1.0])
+def test_get_dropout_mask_values(ops, drop):
+    fix_random_seed(0)
+    mask = ops.get_dropout_mask((100, 50), drop)
+    assert mask.dtype == "float32"
+    assert mask.shape == (100, 50)
+    if drop is None or drop <= 0:
+        assert (mask == 1.0).all()
+    elif drop >= 1.0:
+        assert (mask == 0.0).all()
+    else:
+        kept = mask != 0.0
+        ops.xp.testing.assert_allclose(mask[kept], 1.0 / (1.0 - drop))
+        assert abs(float((~kept).mean()) - drop) < 0.05
+    fix_random_seed(0)
+    ops.xp.testing.assert_allclose(ops.get_dropout_mask((100, 50), drop), mask)
+    if drop is None or drop <= 0 or drop >= 1.0:
+        # No random numbers are needed, so the random state is left alone.
+        fix_random_seed(0)
+        expected = numpy.random.uniform()
+        fix_random_seed(0)
+        ops.get_dropout_mask((100, 50), drop)
+        assert numpy.random.uniform() == expected
+
+
+@pytest.mark.parametrize("ops", ALL_OPS)
+def test_seeded_dropout_edge_rates(ops):
+    X = ops.xp.random.uniform(-1.0, 1.0, (10, 4)).astype("f")
+    Y, seed = ops.seeded_dropout_forward(X, 0.0)
+    ops.xp.testing.assert_allclose(Y, X)
+    Y, seed = ops.seeded_dropout_forward(X, None)
+    ops.xp.testing.assert_allclose(Y, X)
+    Y, seed = ops.seeded_dropout_forward(X, 1.0)
+    assert (Y == 0.0).all()
+    assert (ops.seeded_dropout_backward(X, 1.0, seed) == 0.0).all()
+
+
+@pytest.mark.parametrize("ops", ALL_OPS)
+@pytest.mark.parametrize("dtype", FLOAT_TYPES)
+def test_seeded_dropout(ops, dtype):
+    X = ops.xp.random.uniform(-1.0, 1.0, (200, 200)).astype(dtype)
+    Y, seed = ops.seeded_dropout_forward(X, 0.5)
+    assert Y.dtype == dtype
+    assert abs(float((Y == 0.0).mean()) - 0.5) < 0.05
+    Y2, seed2 = ops.seeded_dropout_forward(X, 0.5, seed)
+    assert seed2 == seed
+    ops.xp.testing.assert_allclose(Y, Y2)
+    dY = ops.xp.ones_like(X)
+    dX = ops.seeded_dropout_backward(dY, 0.5, seed)
+    ops.xp.testing.assert_allclose(Y, X * dX)
+
+
+@pytest.mark.parametrize("ops", XP_OPS)
+@pytest.mark.parametrize("dtype", FLOAT_TYPES)
+@pytest.mark.parametrize("drop", [None, -0.5, 0.0, 0.1, 0.5, 1.0])
+def test_seeded_dropout_against_vanilla(ops, dtype, drop):
+    X = numpy.random.uniform(-1.0, 1.0, (17, 33)).astype(dtype)
+    seed = 2**40 + 12345
+    Y, _ = ops.seeded_dropout_forward(ops.asarray(X), drop, seed)
+    expected, _ = VANILLA_OPS.seeded_dropout_forward(X, drop, seed)
+    assert_allclose(ops.to_numpy(Y), expected)
+    X3d = X.reshape((17, 3, 11))
+    size_at_t = numpy.asarray([3] * 5 + [2] * 7 + [1] * 5, dtype="i")
+    Y, _ = ops.seeded_dropout_padded_forward(
+        ops.asarray(X3d), ops.asarray1i(size_at_t), drop, seed
+    )
+    expected, _ = VANILLA_OPS.seeded_dropout_padded_forward(X3d, size_at_t, drop, seed)
+    assert_allclose(ops.to_numpy(Y), expected)
+
+
+@pytest.mark.parametrize("ops", ALL_OPS)
+@pytest.mark.parametrize("dtype", FLOAT_TYPES)
+@pytest.mark.parametrize("contiguous", [True, False])
+def test_seeded_dropout_backward_inplace(ops, dtype, contiguous):
+    dY = ops.xp.random.uniform(-1.0, 1.0, (30, 20)).astype(dtype)
+    if not contiguous:
+        dY = dY.T
+    seed = 1234
+    expected = ops.seeded_dropout_backward(dY, 0.5, seed)
+    assert expected is not dY
+    dX = ops.seeded_dropout_backward(dY, 0.5, seed, inplace=True)
+    assert dX is dY
+    ops.xp.testing.assert_allclose(dY, expected)
+
+
+@pytest.mark.parametrize("ops", ALL_OPS)
+@pytest.mark.parametrize("dtype", FLOAT_TYPES)
+def test_dropout_callback(ops, dtype):
+    X = ops.xp.random.uniform(-1.0, 1.0, (4, 3, 5)).astype(dtype)
+    Y, backprop = ops.dropout(X, 0.5)
+    assert Y.shape == X.shape
+    dX = backprop(ops.xp.ones_like(X))
+    ops.xp.testing.assert_allclose(Y, X * dX)
+    dY = X.copy()
+    assert ops.dropout(X, 0.5, inplace_backward=True)[1](dY) is dY
+    size_at_t = ops.asarray1i([3, 2, 2, 1])
+    Y, backprop = ops.dropout(X, 0.5, size_at_t=size_at_t)
+    assert (ops.to_numpy(Y)[1:, 2] == 0).all()
+    ops.xp.testing.assert_allclose(backprop(X), Y)
+
+
+@pytest.mark.parametrize("ops", ALL_OPS)
+@pytest.mark.parametrize("dtype", FLOAT_TYPES)
+@pytest.mark.parametrize("drop", [None, 0.5, 1.0])
+def test_seeded_dropout_padded(ops, dtype, drop):
+    X = ops.xp.random.uniform(-1.0, 1.0, (4, 3, 5)).astype(dtype)
+    size_at_t = ops.asarray1i([3, 2, 2, 1])
+    seed = 2**40 + 12345
+    Y, seed2 = ops.seeded_dropout_padded_forward(X, size_at_t, drop, seed)
+    assert seed2 == seed
+    expected, _ = ops.seeded_dropout_forward(X, drop, seed)
+    valid = ops.to_numpy(ops.xp.arange(3)[None, :] < size_at_t[:, None])
+    assert_allclose(ops.to_numpy(Y)[valid], ops.to_numpy(expected)[valid])
+    assert (ops.to_numpy(Y)[~valid] == 0).all()
+    dX = ops.seeded_dropout_padded_backward(X, size_at_t, drop, seed)
+    assert_allclose(ops.to_numpy(dX), ops.to_numpy(Y))
+    dY = X.copy()
+    dX = ops.seeded_dropout_padded_backward(dY, size_at_t, drop, seed, inplace=True)
+    assert dX is dY
+    assert_allclose(ops.to_numpy(dY), ops.to_numpy(Y))
+    with pytest.raises(ValueError):
+        ops.seeded_dropout_padded_forward(X, size_at_t[:2], drop, seed)
+    with pytest.raises(ValueError):
+        ops.seeded_dropout_padded_forward(X.reshape((4, 15)), size_at_t, drop, seed)
+
+
+@pytest.mark.parametrize("ops", XP_OPS)
+def test_dropout_fix_random_seed(ops):
+    X = ops.xp.ones((20, 20), dtype="f")
+    fix_random_seed(0)
+    Y1, _ = ops.dropout(X, 0.5)
+    fix_random_seed(0)
+    Y2, _ = ops.dropout(X, 0.5)
+    Y3, _ = ops.dropout(X, 0.5)
+    ops.xp.testing.assert_allclose(Y1, Y2)
+    assert (Y1 != Y3).any()
+
+
 @pytest.mark.parametrize("ops", ALL_OPS)
 @pytest.mark.parametrize("dtype", FLOAT_TYPES)
 @pytest.mark.parametrize("index_dtype", ["int32", "uint32"])
@@ -800,6 +939,36 @@ def test_flatten_unflatten_roundtrip(cpu_ops, X):
     assert_allclose(X, unflat2)
 
 
+@pytest.mark.parametrize("ops", ALL_OPS)
+def test_flatten_round_to(ops):
+    X = [ops.xp.ones((3, 2), dtype="f"), ops.xp.ones((2, 2), dtype="f")]
+    flat = ops.flatten(X, round_to=8)
+    assert flat.shape == (8, 2)
+    ops.xp.testing.assert_allclose(flat[5:], 0.0)
+    unflat = ops.unflatten(flat, ops.asarray1i([3, 2]))
+    assert [x.shape for x in unflat] == [(3, 2), (2, 2)]
+    flat = ops.flatten(X, pad=1, round_to=4)
+    assert flat.shape == (8, 2)
+    unflat = ops.unflatten(flat, ops.asarray1i([3, 2]), pad=1)
+    assert [x.shape for x in unflat] == [(3, 2), (2, 2)]
+    assert ops.flatten(X, round_to=5).shape == (5, 2)
+    with pytest.raises(ValueError, match=r"Rounding for flattening must at least be 1"):
+        ops.flatten(X, round_to=0)
+
+
+@pytest.mark.parametrize("ops", ALL_OPS)
+def test_unflatten_offsets(ops):
+    X = [ops.xp.ones((3, 2), dtype="f"), ops.xp.ones((0, 2), dtype="f")]
+    X.append(ops.xp.zeros((2, 2), dtype="f"))
+    lengths = ops.asarray1i([3, 0, 2])
+    flat = ops.flatten(X, pad=1)
+    expected = ops.unflatten(flat, lengths, pad=1)
+    unflat = ops.unflatten(flat, lengths, pad=1, offsets=[4, 4, 7])
+    assert len(unflat) == len(expected)
+    for x, y in zip(unflat, expected):
+        ops.xp.testing.assert_allclose(x, y)
+
+
 @pytest.mark.parametrize("ops", ALL_OPS)
 @pytest.mark.parametrize("dtype", FLOAT_TYPES + INT_TYPES)
 def test_pad(ops, dtype):
@@ -833,6 +1002,37 @@ def test_pad(ops, dtype):
         ops.pad(X, round_to=0)
 
 
+@pytest.mark.parametrize("ops", ALL_OPS)
+@pytest.mark.parametrize("dtype", FLOAT_TYPES + INT_TYPES)
+def test_list2padded_padded2list(ops, dtype):
+    X = [
+        ops.xp.arange(1, 7, dtype=dtype).reshape(3, 2),
+        ops.xp.arange(0, dtype=dtype).reshape(0, 2),
+        ops.xp.arange(7, 15, dtype=dtype).reshape(4, 2),
+        ops.xp.arange(15, 17, dtype=dtype).reshape(1, 2),
+    ]
+    Xp = ops.list2padded(X)
+    assert Xp.data.dtype == dtype
+    assert Xp.data.flags["C_CONTIGUOUS"]
+    ops.xp.testing.assert_allclose(Xp.lengths, [4, 3, 1, 0])
+    ops.xp.testing.assert_allclose(Xp.indices, [2, 0, 3, 1])
+    ops.xp.testing.assert_allclose(Xp.size_at_t, [3, 2, 2, 1])
+    ops.xp.testing.assert_allclose(
+        Xp.data,
+        [
+            [[7, 8], [1, 2], [15, 16], [0, 0]],
+            [[9, 10], [3, 4], [0, 0], [0, 0]],
+            [[11, 12], [5, 6], [0, 0], [0, 0]],
+            [[13, 14], [0, 0], [0, 0], [0, 0]],
+        ],
+    )
+    Y = ops.padded2list(Xp)
+    assert len(Y) == len(X)
+    for x, y in zip(X, Y):
+        ops.xp.testing.assert_allclose(x, y)
+    assert ops.padded2list(ops.list2padded([])) == []
+
+
 @pytest.mark.parametrize("ops", ALL_OPS)
 @pytest.mark.parametrize("dtype", FLOAT_TYPES)
 def test_reduce_sum(ops, dtype):
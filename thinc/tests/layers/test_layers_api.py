@@ -1,14 +1,23 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy
 import pytest
 import srsly
 from numpy.testing import assert_almost_equal
 
-from thinc.api import Dropout, Model, NumpyOps, registry, with_padded
+from thinc.api import Dropout, Model, NumpyOps, registry, set_dropout_rate, with_padded
 from thinc.backends import NumpyOps
 from thinc.compat import has_torch
-from thinc.types import Array2d, Floats2d, FloatsXd, Padded, Ragged, Shape
+from thinc.types import (
+    Array2d,
+    Floats2d,
+    Floats3d,
+    FloatsXd,
+    Ints1d,
+    Padded,
+    Ragged,
+    Shape,
+)
 from thinc.util import data_validation, get_width
 
 OPS = NumpyOps()
@@ -21,6 +30,26 @@ class NoDropoutOps(NumpyOps):
         else:
             raise ValueError("During prediction, dropout should not be applied")
 
+    def seeded_dropout_forward(
+        self, X: FloatsXd, drop: Optional[float], seed: Optional[int] = None
+    ) -> Tuple[FloatsXd, int]:
+        if drop is None or drop <= 0:
+            return super().seeded_dropout_forward(X, drop, seed)
+        else:
+            raise ValueError("During prediction, dropout should not be applied")
+
+    def seeded_dropout_padded_forward(
+        self,
+        X: Floats3d,
+        size_at_t: Ints1d,
+        drop: Optional[float],
+        seed: Optional[int] = None,
+    ) -> Tuple[Floats3d, int]:
+        if drop is None or drop <= 0:
+            return super().seeded_dropout_padded_forward(X, size_at_t, drop, seed)
+        else:
+            raise ValueError("During prediction, dropout should not be applied")
+
 
 array1d = OPS.xp.asarray([1, 2, 3], dtype="f")
 array1dint = OPS.xp.asarray([1, 2, 3], dtype="i")
@@ -183,6 +212,86 @@ def test_dropout(data):
     assert_data_match(dX, data)
 
 
+def _get_dropout_data(data):
+    if isinstance(data, (Ragged, Padded)):
+        return data.data
+    elif isinstance(data, list):
+        return numpy.concatenate(data)
+    return data
+
+
+@pytest.mark.parametrize("data", [array2d, ragged, padded, [array2d, array2d]])
+def test_dropout_backprop_uses_forward_mask(data):
+    model = Dropout(0.5)
+    model.initialize(data, data)
+    Y, backprop = model(data, is_train=True)
+    assert_data_match(Y, data)
+    dX = backprop(data)
+    assert_data_match(dX, data)
+    assert_almost_equal(_get_dropout_data(dX), _get_dropout_data(Y))
+
+
+@pytest.mark.parametrize("data", [array2d, ragged, padded, [array2d, array2d]])
+def test_dropout_backprop_keeps_gradient(data):
+    # The caller may still use the gradient after passing it on, e.g. residual
+    # adds it to the gradient of its input, so the layer mustn't overwrite it.
+    model = Dropout(0.5)
+    Y, backprop = model(data, is_train=True)
+    expected = _get_dropout_data(data).copy()
+    backprop(data)
+    assert_almost_equal(_get_dropout_data(data), expected)
+
+
+def test_dropout_rate_can_be_set_later():
+    # The rate is often only set for training, so a layer constructed with a
+    # rate of 0 must still apply dropout once the rate is changed.
+    model = Dropout(0.0)
+    X = numpy.ones((100, 10), dtype="f")
+    Y, backprop = model(X, is_train=True)
+    assert Y is X
+    assert backprop(X) is X
+    set_dropout_rate(model, 0.5)
+    Y, _ = model(X, is_train=True)
+    assert (Y == 0).any()
+    Y, _ = model(X, is_train=False)
+    assert Y is X
+    model.attrs["is_enabled"] = False
+    Y, _ = model(X, is_train=True)
+    assert Y is X
+
+
+def test_dropout_lists_mixed_shapes():
+    data = [
+        numpy.ones((3, 4), dtype="f"),
+        numpy.ones((0, 4), dtype="f"),
+        numpy.ones((5,), dtype="f"),
+        numpy.ones((2, 3, 2), dtype="f"),
+    ]
+    model = Dropout(0.5)
+    Y, backprop = model(data, is_train=True)
+    assert [y.shape for y in Y] == [x.shape for x in data]
+    dX = backprop(data)
+    assert [dx.shape for dx in dX] == [x.shape for x in data]
+    for y, dx in zip(Y, dX):
+        assert_almost_equal(dx, y)
+    Y, backprop = model([], is_train=True)
+    assert Y == []
+    assert backprop([]) == []
+
+
+def test_dropout_padded_zeroes_padding():
+    ops = NumpyOps()
+    seqs = [numpy.ones((3, 4), dtype="f"), numpy.ones((1, 4), dtype="f")]
+    Xp = ops.list2padded(seqs)
+    Xp.data[1, 1] = 1.0
+    model = Dropout(0.5)
+    Yp, backprop = model(Xp, is_train=True)
+    assert Yp.data.shape == Xp.data.shape
+    assert (Yp.data[1:, 1] == 0).all()
+    dXp = backprop(Xp)
+    assert_almost_equal(dXp.data, Yp.data)
+
+
 @pytest.mark.parametrize("name,kwargs,in_data,out_data", TEST_CASES)
 def test_layers_batching_all(name, kwargs, in_data, out_data):
     cfg = {"@layers": name, **kwargs}
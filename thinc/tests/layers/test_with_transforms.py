@@ -3,6 +3,7 @@ import numpy.testing
 import pytest
 
 from thinc.api import (
+    LayerNorm,
     Linear,
     Model,
     NumpyOps,
@@ -13,6 +14,7 @@ from thinc.api import (
     with_list,
     with_padded,
     with_ragged,
+    with_reshape,
 )
 from thinc.types import Padded, Ragged
 
@@ -258,6 +260,51 @@ def test_with_array_backward(ragged_input, padded_input, list_input, array_input
         check_transform_produces_correct_output_type_backward(model, inputs, checker)
 
 
+def test_with_array2d_padded_noncontiguous(padded_input):
+    model = with_array2d(Linear(nO=4))
+    model.initialize(X=padded_input)
+    data = padded_input.data
+    # Build the same values in a non-contiguous (transposed) layout.
+    strided = numpy.ascontiguousarray(data.transpose((1, 0, 2))).transpose((1, 0, 2))
+    Xp = Padded(
+        strided, padded_input.size_at_t, padded_input.lengths, padded_input.indices
+    )
+    Y, backprop = model.begin_update(padded_input)
+    Y_strided, backprop_strided = model.begin_update(Xp)
+    numpy.testing.assert_allclose(Y.data, Y_strided.data)
+    dY = Y.copy()
+    dX = backprop(dY)
+    dX_strided = backprop_strided(dY)
+    numpy.testing.assert_allclose(dX.data, dX_strided.data)
+    assert dX.data.shape == data.shape
+
+
+def test_with_array2d_round_to():
+    Xs = [numpy.random.uniform(-1, 1, (n, 2)).astype("f") for n in (3, 1, 0, 2)]
+    model = with_array2d(Linear(nO=3, nI=2), round_to=8)
+    model.initialize()
+    Ys, backprop = model.begin_update(Xs)
+    assert [Y.shape for Y in Ys] == [(len(X), 3) for X in Xs]
+    for X, Y in zip(Xs, Ys):
+        numpy.testing.assert_allclose(Y, model.layers[0].predict(X), rtol=1e-5)
+    dXs = backprop(Ys)
+    assert [dX.shape for dX in dXs] == [X.shape for X in Xs]
+
+
+@pytest.mark.parametrize("n_seqs", [1, 3])
+def test_with_array2d_pointwise_list(n_seqs):
+    Xs = [numpy.random.uniform(-1, 1, (n + 1, 4)).astype("f") for n in range(n_seqs)]
+    model = with_array2d(LayerNorm(nI=4), pad=2)
+    model.initialize()
+    assert model.layers[0].attrs["is_pointwise"]
+    Ys, backprop = model.begin_update(Xs)
+    assert len(Ys) == len(Xs)
+    for X, Y in zip(Xs, Ys):
+        numpy.testing.assert_allclose(Y, model.layers[0].predict(X), rtol=1e-5)
+    dXs = backprop(Ys)
+    assert [dX.shape for dX in dXs] == [X.shape for X in Xs]
+
+
 def test_with_list_backward(ragged_input, padded_input, list_input):
     for inputs in (ragged_input, padded_input, list_input):
         checker = get_data_checker(inputs)
@@ -283,6 +330,77 @@ def test_with_padded_backward(
         check_transform_produces_correct_output_type_backward(model, inputs, checker)
 
 
+def test_with_padded_ragged_list_backward_values(ops):
+    # Scale each batch column by its position, so that any mistake in mapping
+    # rows to padded cells on the way back shows up in the gradient.
+    def _scale_forward(model, Xp, is_train):
+        scale = model.ops.xp.arange(1, Xp.data.shape[1] + 1, dtype="f")
+        scale = scale.reshape((1, -1, 1))
+
+        def backprop(dYp):
+            return Padded(dYp.data * scale, dYp.size_at_t, dYp.lengths, dYp.indices)
+
+        return Padded(Xp.data * scale, Xp.size_at_t, Xp.lengths, Xp.indices), backprop
+
+    model = with_padded(Model("scale", _scale_forward))
+    Xs = [ops.xp.random.uniform(-1, 1, (n, 3)).astype("f") for n in (2, 5, 0, 3)]
+    Xp = ops.list2padded(Xs)
+    Ys, backprop = model.begin_update(Xs)
+    dXs = backprop(Xs)
+    Xr = Ragged(ops.flatten(Xs), ops.asarray1i([len(X) for X in Xs]))
+    Yr, backprop_r = model.begin_update(Xr)
+    dXr = backprop_r(Xr)
+    start = 0
+    for i, X in enumerate(Xs):
+        # Each sequence is scaled by one more than its position in the batch.
+        scale = float(list(Xp.indices).index(i) + 1)
+        end = start + len(X)
+        numpy.testing.assert_allclose(Ys[i], X * scale)
+        numpy.testing.assert_allclose(dXs[i], X * scale)
+        numpy.testing.assert_allclose(Yr.data[start:end], X * scale)
+        numpy.testing.assert_allclose(dXr.data[start:end], X * scale)
+        start = end
+
+
+def test_with_padded_tuple_dispatch(padded_data_input, list_input):
+    # Tuples can hold either padded data or a sequence of arrays, so the
+    # dispatch for them can't be decided by the type alone.
+    model = with_padded(noop())
+    checker = get_data_checker(padded_data_input)
+    check_transform_produces_correct_output_type_forward(
+        model, padded_data_input, checker
+    )
+    # A tuple of arrays after padded data still goes through the list path...
+    outputs = model.predict(tuple(list_input))
+    assert len(outputs) == len(list_input)
+    for X, Y in zip(list_input, outputs):
+        numpy.testing.assert_equal(X, Y)
+    # ...and a tuple of four 2d arrays isn't padded data either.
+    four_arrays = tuple(numpy.ones((i + 1, 2), dtype="f") for i in range(4))
+    outputs = model.predict(four_arrays)
+    assert [Y.shape for Y in outputs] == [X.shape for X in four_arrays]
+    # After those, padded data must still be treated as such.
+    Y = model.predict(padded_data_input)
+    assert isinstance(Y, tuple) and len(Y) == 4
+    assert Y[0].shape == padded_data_input[0].shape
+
+
+def test_with_reshape():
+    X = numpy.random.uniform(-1, 1, (4, 5, 2)).astype("f")
+    model = with_reshape(Linear(nO=3, nI=2))
+    model.initialize(X=X)
+    Y, backprop = model.begin_update(X)
+    assert Y.shape == (4, 5, 3)
+    numpy.testing.assert_allclose(Y[1, 2], model.layers[0].predict(X[1, 2:3])[0])
+    dX = backprop(Y)
+    assert dX.shape == X.shape
+    # Non-contiguous inputs should give the same results.
+    X_strided = numpy.ascontiguousarray(X.transpose((1, 0, 2))).transpose((1, 0, 2))
+    Y_strided, backprop_strided = model.begin_update(X_strided)
+    numpy.testing.assert_allclose(Y, Y_strided)
+    numpy.testing.assert_allclose(dX, backprop_strided(Y))
+
+
 def test_with_getitem():
     data = (
         numpy.asarray([[1, 2, 3, 4]], dtype="f"),